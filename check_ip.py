@@ -5,44 +5,82 @@ Simple script to check your current IP address
 
 import requests
 import socket
-import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared session so repeated lookups reuse pooled keep-alive connections.
+# Transient failures (connection resets, 429/5xx) are retried with
+# exponential backoff; the per-call timeout still bounds each attempt.
+http_retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+http_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=http_retry)
+http_session = requests.Session()
+http_session.mount('http://', http_adapter)
+http_session.mount('https://', http_adapter)
+
+# The external IP services race each other, which already gives redundancy;
+# retrying them would only stretch a dead service to several timeouts
+race_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=0)
+race_session = requests.Session()
+race_session.mount('http://', race_adapter)
+race_session.mount('https://', race_adapter)
+
+# IP lookup services and how to extract the address from each response
+IP_SERVICES = {
+    'https://api.ipify.org?format=json': lambda r: r.json()['ip'],
+    'https://httpbin.org/ip': lambda r: r.json()['origin'],
+    'https://api.ip.sb/ip': lambda r: r.text.strip(),
+}
+
+def _query_ip_service(service):
+    """Query a single IP lookup service, returning the IP or None"""
+    response = race_session.get(service, timeout=5)
+    if response.status_code == 200:
+        return IP_SERVICES[service](response)
+    return None
 
 def get_external_ip():
     """Get external (public) IP address"""
     try:
-        # Try multiple services in case one is down
-        services = [
-            'https://api.ipify.org?format=json',
-            'https://httpbin.org/ip',
-            'https://api.ip.sb/ip'
-        ]
+        # Query all services concurrently and use the first one that answers.
+        # Daemon threads (not an executor, whose workers are joined at exit) let
+        # the script exit without waiting on slower services; the tradeoff is
+        # that all services are contacted and the losers are abandoned mid-request.
+        results = queue.Queue()
         
-        for service in services:
+        def query(service):
             try:
-                response = requests.get(service, timeout=5)
-                if response.status_code == 200:
-                    if 'ipify' in service:
-                        return response.json()['ip']
-                    elif 'httpbin' in service:
-                        return response.json()['origin']
-                    else:
-                        return response.text.strip()
-            except:
-                continue
+                results.put(_query_ip_service(service))
+            except Exception:
+                results.put(None)
+        
+        for service in IP_SERVICES:
+            threading.Thread(target=query, args=(service,), daemon=True).start()
+        for _ in IP_SERVICES:
+            ip = results.get()
+            if ip:
+                return ip
         return "Unable to determine"
     except Exception as e:
         return f"Error: {e}"
 
+# Local IP rarely changes within a process; remember the first lookup
+_local_ip_cache = None
+
 def get_local_ip():
     """Get local network IP address"""
+    global _local_ip_cache
+    if _local_ip_cache:
+        return _local_ip_cache
     try:
         # Connect to a remote address to determine local IP
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        local_ip = s.getsockname()[0]
-        s.close()
-        return local_ip
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            _local_ip_cache = s.getsockname()[0]
+        return _local_ip_cache
     except Exception as e:
         return f"Error: {e}"
 
@@ -53,10 +91,10 @@ def get_hostname():
     except Exception as e:
         return f"Error: {e}"
 
-def get_ip_info(ip):
-    """Get detailed information about an IP address"""
+def get_ip_info(ip=None):
+    """Get detailed information about an IP address (defaults to our own)"""
     try:
-        response = requests.get(f'http://ip-api.com/json/{ip}', timeout=5)
+        response = http_session.get(f'http://ip-api.com/json/{ip or ""}', timeout=5)
         if response.status_code == 200:
             return response.json()
         return None
@@ -69,10 +107,14 @@ def main():
     print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
-    # Get basic IP information
-    external_ip = get_external_ip()
-    local_ip = get_local_ip()
-    hostname = get_hostname()
+    # Get basic IP information; the location lookup runs alongside the
+    # external IP lookup since ip-api resolves our own address by default
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        ip_info_future = executor.submit(get_ip_info)
+        external_ip = get_external_ip()
+        local_ip = get_local_ip()
+        hostname = get_hostname()
+        ip_info = ip_info_future.result()
     
     print(f"🌍 External IP: {external_ip}")
     print(f"🏠 Local IP:    {local_ip}")
@@ -83,7 +125,6 @@ def main():
     if external_ip and "Error" not in external_ip and "Unable" not in external_ip:
         print("📍 Location Information:")
         print("-" * 25)
-        ip_info = get_ip_info(external_ip)
         if ip_info and ip_info.get('status') == 'success':
             print(f"Country: {ip_info.get('country', 'Unknown')}")
             print(f"Region:  {ip_info.get('regionName', 'Unknown')}")
@@ -1,102 +1,136 @@
 from fastapi import FastAPI, BackgroundTasks, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, Response
 from pydantic import BaseModel
-import json
+import orjson
 import uuid
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 import asyncio
 import os
 import threading
 import time
+import subprocess
 from datetime import datetime, timedelta
 import zipfile
 import shutil
 from concurrent.futures import ThreadPoolExecutor
 import yt_dlp
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields
 import re
 import hashlib
-import glob
+import tempfile
+from functools import lru_cache, partial
 # Use direct connection (most reliable for YouTube)
 print("✅ Using direct connection - most reliable and fastest option")
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Direct connection initialization (most reliable)
 print("✅ Direct connection initialized - optimal for YouTube scraping")
 # Proxy initialization would go here if needed in future
 
+# Translation table for sanitize_filename: replace characters that are invalid
+# in filenames with '_' and drop control characters, in a single C-level pass
+_FILENAME_TRANSLATION = str.maketrans(
+    {**{c: '_' for c in '<>:"/\\|?*'},
+     **{c: None for c in range(0x00, 0x20)},
+     **{c: None for c in range(0x7f, 0xa0)}}
+)
+MAX_FILENAME_LENGTH = 200
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for filesystem compatibility"""
-    # Remove or replace problematic characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    filename = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', filename)
-    # Limit length
-    if len(filename) > 200:
-        filename = filename[:200]
-    return filename.strip()
+    # Replace problematic characters, remove control characters, limit length
+    return filename.translate(_FILENAME_TRANSLATION)[:MAX_FILENAME_LENGTH].strip()
+
+# Canonical 11-character YouTube video ID in watch, youtu.be and shorts URLs
+_YOUTUBE_ID_RE = re.compile(r'(?:[?&]v=|youtu\.be/|/shorts/)([A-Za-z0-9_-]{11})')
+# Video ID path segment used by other sites, e.g. ".../video/<id>/..."
+_VIDEO_PATH_ID_RE = re.compile(r'/video/([^/]+)')
 
+@lru_cache(maxsize=4096)
 def generate_video_id_hash(url: str) -> str:
-    """Generate a consistent hash for video identification"""
-    # Extract video ID from URL for consistent hashing
-    video_id = None
-    if "youtube.com/watch?v=" in url:
-        video_id = url.split("watch?v=")[1].split("&")[0]
-    elif "youtu.be/" in url:
-        video_id = url.split("youtu.be/")[1].split("?")[0]
-    elif "/video/" in url:
-        video_id = url.split("/video/")[1].split("/")[0]
-    
-    if video_id:
-        return hashlib.md5(video_id.encode()).hexdigest()[:12]
+    """Generate a consistent identifier for video identification"""
+    # YouTube URLs use the video ID itself: it is what yt-dlp puts in the
+    # filename (%(id)s), and it is the same for ?t=/&list= variants of a URL
+    match = _YOUTUBE_ID_RE.search(url)
+    if match:
+        return match.group(1)
+
+    # Other sites: hash the video ID from the URL path, or the whole URL.
+    # A 6-byte BLAKE2b digest yields the 12-hex-char key directly, no slicing.
+    match = _VIDEO_PATH_ID_RE.search(url)
+    if match:
+        return hashlib.blake2b(match.group(1).encode(), digest_size=6).hexdigest()
     else:
         # Fallback to URL hash
-        return hashlib.md5(url.encode()).hexdigest()[:12]
+        return hashlib.blake2b(url.encode(), digest_size=6).hexdigest()
 
-def check_existing_file(download_dir: str, title: str, video_id_hash: str, audio_only: bool = False) -> Optional[str]:
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.webm', '.mkv', '.avi', '.mov'})
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.m4a', '.webm', '.ogg'})
+# Formats that are already compressed; deflating them again gains nothing
+COMPRESSED_MEDIA_EXTENSIONS = VIDEO_EXTENSIONS | AUDIO_EXTENSIONS
+
+# Matches the trailing "_<video id>[.f<format>].<ext>" of files named by our outtmpl
+_FILENAME_VIDEO_ID_RE = re.compile(r'_([A-Za-z0-9_-]{11})(?:\.f\d+)?\.[A-Za-z0-9]+$')
+# Looser variant for in-progress names such as "<title>_<id>.f137.mp4.part"
+_PARTIAL_FILENAME_VIDEO_ID_RE = re.compile(r'_(?=([A-Za-z0-9_-]{11})\.)')
+
+@dataclass
+class DownloadIndex:
+    """Snapshot of a download directory used for duplicate detection"""
+    by_video_id: Dict[str, str] = field(default_factory=dict)  # video ID -> filename
+    title_words: List[Tuple[str, frozenset]] = field(default_factory=list)  # (filename, lowercased name words)
+    sizes: Dict[str, int] = field(default_factory=dict)  # filename -> size in bytes
+
+def build_download_index(download_dir: str, audio_only: bool = False) -> DownloadIndex:
+    """
+    Scan the download directory once and index the existing media files.
+    Lets a whole batch be checked for duplicates without re-scanning per video.
+    """
+    index = DownloadIndex()
+    possible_extensions = AUDIO_EXTENSIONS if audio_only else VIDEO_EXTENSIONS
+    try:
+        with os.scandir(download_dir) as entries:
+            for entry in entries:
+                name, ext = os.path.splitext(entry.name)
+                if ext not in possible_extensions or not entry.is_file():
+                    continue
+                match = _FILENAME_VIDEO_ID_RE.search(entry.name)
+                if match:
+                    index.by_video_id.setdefault(match.group(1), entry.name)
+                index.title_words.append((entry.name, frozenset(name.lower().split())))
+                index.sizes[entry.name] = entry.stat().st_size
+    except FileNotFoundError:
+        pass
+    return index
+
+def check_existing_file(download_dir: str, title: str, video_id_hash: str, audio_only: bool = False,
+                        index: Optional[DownloadIndex] = None) -> Optional[str]:
     """
     Check if a file already exists in the download directory.
     Returns the existing filename if found, None otherwise.
+    Pass an index from build_download_index to avoid re-scanning the directory.
     """
-    if not os.path.exists(download_dir):
-        return None
-    
-    sanitized_title = sanitize_filename(title)
-    possible_extensions = ['.mp4', '.webm', '.mkv', '.avi', '.mov'] if not audio_only else ['.mp3', '.m4a', '.webm', '.ogg']
+    if index is None:
+        if not os.path.exists(download_dir):
+            return None
+        index = build_download_index(download_dir, audio_only)
     
     # Check for exact matches with video ID hash
-    for ext in possible_extensions:
-        patterns = [
-            f"{sanitized_title}_{video_id_hash}{ext}",
-            f"{sanitized_title}_{video_id_hash}.f*{ext}",  # yt-dlp format codes
-            f"*{video_id_hash}*{ext}",  # any file with video ID hash
-        ]
-        
-        for pattern in patterns:
-            matches = glob.glob(os.path.join(download_dir, pattern))
-            if matches:
-                return os.path.basename(matches[0])
+    existing_file = index.by_video_id.get(video_id_hash)
+    if existing_file:
+        return existing_file
     
     # Fallback: check by title similarity (70% match)
-    existing_files = [f for f in os.listdir(download_dir) if os.path.isfile(os.path.join(download_dir, f))]
-    for existing_file in existing_files:
-        # Remove extension for comparison
-        existing_name = os.path.splitext(existing_file)[0]
-        existing_ext = os.path.splitext(existing_file)[1]
-        
-        # Check if extension matches what we're looking for
-        if existing_ext not in possible_extensions:
-            continue
-            
-        # Simple similarity check
-        title_words = set(sanitized_title.lower().split())
-        existing_words = set(existing_name.lower().split())
-        
-        if len(title_words) > 0:
-            similarity = len(title_words.intersection(existing_words)) / len(title_words.union(existing_words))
-            if similarity > 0.7:  # 70% similarity threshold
-                return existing_file
+    title_words = frozenset(sanitize_filename(title).lower().split())
+    if not title_words:
+        return None
+    for existing_file, existing_words in index.title_words:
+        # Simple similarity check (Jaccard index of the word sets)
+        similarity = len(title_words & existing_words) / len(title_words | existing_words)
+        if similarity > 0.7:  # 70% similarity threshold
+            return existing_file
     
     return None
 
@@ -111,52 +145,181 @@ def get_shared_download_dir(audio_only: bool = False) -> str:
     os.makedirs(shared_dir, exist_ok=True)
     return shared_dir
 
+# Buffer size for writing task zips and copying files into them; large
+# buffers coalesce zipfile's many small writes into few syscalls
+ZIP_IO_BUFFER_SIZE = 1024 * 1024
+
+# Process umask, read once at import (os.umask can only be queried by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 def create_task_zip_file(task_id: str, shared_download_dir: str, zip_path: str):
     """Create a zip file containing only the files downloaded in this specific task"""
-    with storage_lock:
+    with get_task_lock(task_id):
         videos = video_downloads.get(task_id, [])
     
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for video in videos:
-            if video.status in ['completed', 'skipped'] and video.filename:
-                file_path = os.path.join(shared_download_dir, video.filename)
-                if os.path.exists(file_path):
+    # Build the archive under a temporary name and rename it into place, so
+    # /api/zip never serves a half-written zip
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(zip_path) or '.', suffix='.zip.part')
+    try:
+        with os.fdopen(fd, 'wb', buffering=ZIP_IO_BUFFER_SIZE) as f, \
+                zipfile.ZipFile(f, 'w', zipfile.ZIP_STORED, allowZip64=True) as zipf:
+            for video in videos:
+                if video.status in ['completed', 'skipped'] and video.filename:
+                    file_path = os.path.join(shared_download_dir, video.filename)
+                    if not os.path.exists(file_path):
+                        continue
                     # Add file to zip with just the filename (no folder structure)
-                    zipf.write(file_path, video.filename)
+                    if os.path.splitext(video.filename)[1].lower() in COMPRESSED_MEDIA_EXTENSIONS:
+                        # Media files are already compressed, so store them as-is
+                        # (streamed in large blocks) rather than spending CPU on deflate
+                        zinfo = zipfile.ZipInfo.from_file(file_path, video.filename)
+                        with open(file_path, 'rb') as src, zipf.open(zinfo, 'w', force_zip64=True) as dst:
+                            shutil.copyfileobj(src, dst, ZIP_IO_BUFFER_SIZE)
+                    else:
+                        # Anything else gets the fastest deflate level
+                        zipf.write(file_path, video.filename,
+                                   compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+        # mkstemp creates the file 0600; give the zip the normal umask-derived mode
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, zip_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+# task_id -> Event set once an in-flight zip build for that task finishes
+zip_build_events: Dict[str, asyncio.Event] = {}
+
+async def build_task_zip(task_id: str, shared_download_dir: str, zip_path: str):
+    """Build a task zip in the download threadpool, sharing any build already in flight"""
+    event = zip_build_events.get(task_id)
+    if event:
+        # Another request is already writing this zip; wait for it instead of racing
+        await event.wait()
+        return
+    event = zip_build_events[task_id] = asyncio.Event()
+    try:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(download_executor, create_task_zip_file, task_id, shared_download_dir, zip_path)
+    finally:
+        event.set()
+        zip_build_events.pop(task_id, None)
+
+# MP3 encodes get their own small pool, so download workers move straight on to
+# the next video while finished ones encode, and ffmpeg can't starve them of CPU
+MP3_CONVERSION_LIMIT = 2
+mp3_executor = ThreadPoolExecutor(max_workers=MP3_CONVERSION_LIMIT)
+
+def probe_audio_codec(path: str) -> Optional[str]:
+    """Return the codec name of a file's first audio stream, or None if ffprobe can't tell"""
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-select_streams', 'a:0', '-show_entries', 'stream=codec_name',
+             '-of', 'default=noprint_wrappers=1:nokey=1', path],
+            capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+def convert_to_mp3(source_path: str) -> str:
+    """Convert an audio file to MP3 with ffmpeg, returning the new path"""
+    base, ext = os.path.splitext(source_path)
+    if ext.lower() == '.mp3':
+        return source_path
+    target_path = base + '.mp3'
+    ffmpeg_cmd = ['ffmpeg', '-y', '-loglevel', 'error', '-i', source_path, '-vn']
+    if probe_audio_codec(source_path) == 'mp3':
+        # Already MP3 audio in another container: remux without re-encoding
+        subprocess.run(ffmpeg_cmd + ['-c:a', 'copy', target_path], check=True)
+    else:
+        subprocess.run(
+            ffmpeg_cmd + ['-c:a', 'libmp3lame', '-b:a', '192k', '-threads', '1', target_path],
+            check=True,
+        )
+    os.remove(source_path)
+    return target_path
 
 # Global event loop reference (set on startup)
 MAIN_LOOP: Optional[asyncio.AbstractEventLoop] = None
+progress_flusher_task: Optional[asyncio.Task] = None  # keeps the flusher from being garbage collected
+
+# Tasks with progress changes not yet pushed; only touched on MAIN_LOOP
+dirty_tasks: set = set()
+PROGRESS_FLUSH_INTERVAL = 0.15  # seconds between coalesced progress pushes
+
+def mark_progress_dirty(task_id: str):
+    """Queue a progress push for a task (safe to call from worker threads)"""
+    MAIN_LOOP.call_soon_threadsafe(dirty_tasks.add, task_id)
+
+# task_id -> progress push still being sent; a slow client only holds up its own task
+progress_sends: Dict[str, asyncio.Task] = {}
+
+def _progress_send_done(task_id: str, task: asyncio.Task):
+    progress_sends.pop(task_id, None)
+    if not task.cancelled() and task.exception():
+        print("progress flush error:", task.exception())
+
+async def progress_flusher():
+    """Push one progress update per changed task every PROGRESS_FLUSH_INTERVAL"""
+    while True:
+        await asyncio.sleep(PROGRESS_FLUSH_INTERVAL)
+        if not dirty_tasks:
+            continue
+        pending = list(dirty_tasks)
+        dirty_tasks.clear()
+        # Build every payload (and its storage writes) before anything is awaited,
+        # all stamped with one timestamp; later status writes can only be newer
+        now_iso = datetime.now().isoformat()
+        payloads = []
+        for task_id in pending:
+            if task_id in progress_sends:
+                # Previous push is still going out; retry on a later tick
+                dirty_tasks.add(task_id)
+                continue
+            try:
+                payload = build_progress_payload(task_id, now_iso)
+            except Exception as e:
+                print("progress flush error:", e)
+                continue
+            if payload is not None:
+                payloads.append((task_id, payload))
+        # Send each task on its own so one stalled socket doesn't delay the others
+        for task_id, payload in payloads:
+            send = asyncio.create_task(manager.send_update(task_id, payload))
+            progress_sends[task_id] = send
+            send.add_done_callback(partial(_progress_send_done, task_id))
 
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
+        # Only touched from coroutines on the event loop, so no lock is needed
         self.active_connections: Dict[str, WebSocket] = {}
-        self.lock = threading.Lock()
     
     async def connect(self, websocket: WebSocket, task_id: str):
         await websocket.accept()
-        with self.lock:
-            self.active_connections[task_id] = websocket
+        self.active_connections[task_id] = websocket
     
-    def disconnect(self, task_id: str):
-        with self.lock:
-            if task_id in self.active_connections:
-                del self.active_connections[task_id]
+    def disconnect(self, task_id: str, websocket: WebSocket):
+        # Only unregister this socket; a newer one may have replaced it for the task
+        if self.active_connections.get(task_id) is websocket:
+            del self.active_connections[task_id]
     
     async def send_update(self, task_id: str, data: dict):
-        ws = None
-        with self.lock:
-            ws = self.active_connections.get(task_id)
+        ws = self.active_connections.get(task_id)
         if ws:
             try:
-                await ws.send_text(json.dumps(data))
+                await ws.send_text(orjson.dumps(data).decode())
             except Exception:
                 # Connection closed or error — cleanup
-                self.disconnect(task_id)
+                self.disconnect(task_id, ws)
 
 manager = ConnectionManager()
 
 # Helpers for human readable formatting
+# Both formatters are memoized: callers pass whole numbers, and speeds/ETAs
+# repeat constantly across progress ticks
+@lru_cache(maxsize=4096)
 def format_bytes(num_bytes: Optional[float]) -> str:
     if not num_bytes:
         return "0 B/s"
@@ -167,6 +330,7 @@ def format_bytes(num_bytes: Optional[float]) -> str:
         b /= 1024.0
     return f"{b:.1f} PB/s"
 
+@lru_cache(maxsize=4096)
 def format_eta(seconds: Optional[float]) -> str:
     if seconds is None:
         return "Unknown"
@@ -194,11 +358,54 @@ class VideoDownload:
     video_id_hash: str = ""
     skipped_reason: str = ""
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Any mutation invalidates the cached dict
+        object.__setattr__(self, '_dict_cache', None)
+
+    def to_dict(self) -> dict:
+        """Return the fields as a dict, cached until the next mutation"""
+        cached = self._dict_cache
+        if cached is None:
+            values = self.__dict__
+            cached = {name: values[name] for name in VIDEO_DOWNLOAD_FIELDS}
+            object.__setattr__(self, '_dict_cache', cached)
+        return cached
+
+# Field names in declaration order, computed once for VideoDownload.to_dict
+VIDEO_DOWNLOAD_FIELDS = tuple(f.name for f in fields(VideoDownload))
+
 # In-memory storage
 tasks_storage: Dict[str, dict] = {}
 video_downloads: Dict[str, List[VideoDownload]] = {}
+video_index_by_hash: Dict[str, Dict[str, int]] = {}  # task_id -> video_id_hash -> index in video_downloads
+video_status_counts: Dict[str, Dict[str, int]] = {}  # task_id -> status -> number of videos in it
+progress_payloads: Dict[str, dict] = {}  # task_id -> reused progress_update WebSocket message
+progress_sent_videos: Dict[str, List[dict]] = {}  # task_id -> video dicts in the last progress push
 download_executor = ThreadPoolExecutor(max_workers=4)
-storage_lock = threading.Lock()  # protects tasks_storage and video_downloads for thread-safety
+# Parallel fragment downloads per video; drop back to 4 if YouTube starts throttling
+FRAGMENT_CONCURRENCY = 8
+# Minimum seconds / percentage points between progress pushes for one video
+PROGRESS_PUSH_INTERVAL = 0.25
+PROGRESS_PUSH_MIN_DELTA = 1.0
+storage_lock = threading.RLock()  # guards adding tasks to / iterating tasks_storage and video_downloads
+task_locks: Dict[str, threading.RLock] = {}  # task_id -> lock for that task's status and videos
+
+def get_task_lock(task_id: str) -> threading.RLock:
+    """Return the lock protecting one task's state (the global lock for unknown tasks)"""
+    return task_locks.get(task_id, storage_lock)
+
+def set_video_status(task_id: str, vd: VideoDownload, status: str):
+    """Change a video's status, keeping the task's status counts in step"""
+    with get_task_lock(task_id):
+        counts = video_status_counts.setdefault(task_id, {})
+        counts[vd.status] = counts.get(vd.status, 0) - 1
+        counts[status] = counts.get(status, 0) + 1
+        vd.status = status
+
+def count_finished(counts: Dict[str, int]) -> int:
+    """Number of videos that are done successfully (downloaded or already present)"""
+    return counts.get('completed', 0) + counts.get('skipped', 0)
 
 class DownloadRequest(BaseModel):
     channel_url: str
@@ -222,26 +429,27 @@ def convert_channel_to_playlist(channel_url: str) -> str:
 
 @app.on_event("startup")
 async def startup_event():
-    global MAIN_LOOP
+    global MAIN_LOOP, progress_flusher_task
     MAIN_LOOP = asyncio.get_running_loop()
+    progress_flusher_task = asyncio.create_task(progress_flusher())
     # ensure downloads dir exists
     os.makedirs("downloads", exist_ok=True)
 
 @app.websocket("/ws/{task_id}")
 async def websocket_endpoint(websocket: WebSocket, task_id: str):
     await manager.connect(websocket, task_id)
+    # A new client needs the full video list before it can apply deltas
+    progress_sent_videos.pop(task_id, None)
     try:
         # Send current status immediately
         if task_id in tasks_storage:
             await manager.send_update(task_id, {"type": "status_update", "data": tasks_storage[task_id]})
         while True:
-            # Sleep briefly to keep connection alive; most updates are pushed from worker
-            await asyncio.sleep(5)
-            # Optionally send a heartbeat/status if available
-            if task_id in tasks_storage:
-                await manager.send_update(task_id, {"type": "status_update", "data": tasks_storage[task_id]})
+            # Updates are pushed by the status/progress update paths as state
+            # changes; here we only wait for the client to go away
+            await websocket.receive_text()
     except WebSocketDisconnect:
-        manager.disconnect(task_id)
+        manager.disconnect(task_id, websocket)
 
 @app.post("/api/download")
 async def start_download(request: DownloadRequest, background_tasks: BackgroundTasks):
@@ -250,7 +458,9 @@ async def start_download(request: DownloadRequest, background_tasks: BackgroundT
     optimized_url = convert_channel_to_playlist(request.channel_url)
     
     # Initialize video downloads list and task status
+    now_iso = datetime.now().isoformat()
     with storage_lock:
+        task_locks[task_id] = threading.RLock()
         video_downloads[task_id] = []
         task_status = {
             "status": "initializing",
@@ -258,7 +468,7 @@ async def start_download(request: DownloadRequest, background_tasks: BackgroundT
             "total_videos": request.max_videos,
             "current_video": "Fetching video list...",
             "channel_url": optimized_url,
-            "created_at": datetime.now().isoformat(),
+            "created_at": now_iso,
             "error_message": None,
             "downloaded_files": [],
             "zip_available": False,
@@ -268,7 +478,7 @@ async def start_download(request: DownloadRequest, background_tasks: BackgroundT
             "eta": "Calculating...",
             "success_count": 0,
             "failure_count": 0,
-            "updated_at": datetime.now().isoformat()
+            "updated_at": now_iso
         }
         tasks_storage[task_id] = task_status
 
@@ -277,16 +487,34 @@ async def start_download(request: DownloadRequest, background_tasks: BackgroundT
     
     return {"task_id": task_id, "message": "Download started"}
 
+def same_items(a: Optional[list], b: Optional[list]) -> bool:
+    """True if both lists hold the very same objects (or both are None)"""
+    if a is None or b is None:
+        return a is b
+    return len(a) == len(b) and all(x is y for x, y in zip(a, b))
+
+# task_id -> (task updated_at, per-video dicts, serialized /api/status body)
+status_cache: Dict[str, Tuple[Optional[str], Optional[List[dict]], bytes]] = {}
+
 @app.get("/api/status/{task_id}")
 async def get_status(task_id: str):
     """Get current status of a download task"""
-    with storage_lock:
+    with get_task_lock(task_id):
         if task_id not in tasks_storage:
             raise HTTPException(status_code=404, detail="Task not found")
-        status = tasks_storage[task_id].copy()
-        if task_id in video_downloads:
-            status["video_downloads"] = [asdict(v) for v in video_downloads[task_id]]
-    return status
+        task = tasks_storage[task_id]
+        videos = [v.to_dict() for v in video_downloads[task_id]] if task_id in video_downloads else None
+        # Video dicts are rebuilt on mutation, so identical objects mean nothing changed
+        cached = status_cache.get(task_id)
+        if cached and cached[0] == task.get('updated_at') and same_items(cached[1], videos):
+            body = cached[2]
+        else:
+            status = task.copy()
+            if videos is not None:
+                status["video_downloads"] = videos
+            body = orjson.dumps(status)
+            status_cache[task_id] = (task.get('updated_at'), videos, body)
+    return Response(content=body, media_type='application/json')
 
 @app.get("/api/tasks")
 async def list_tasks():
@@ -304,24 +532,28 @@ async def list_downloads(task_id: str):
     if not os.path.exists(download_dir):
         raise HTTPException(status_code=404, detail="Download directory not found")
     
-    files = []
-    for filename in os.listdir(download_dir):
-        if os.path.isfile(os.path.join(download_dir, filename)) and not filename.endswith('.zip'):
-            file_path = os.path.join(download_dir, filename)
-            file_size = os.path.getsize(file_path)
-            files.append({
-                "filename": filename,
-                "size": file_size,
-                "download_url": f"/api/file/{task_id}/{filename}"
-            })
+    def list_files():
+        files = []
+        # DirEntry caches the file type, so only the size needs a stat per file
+        with os.scandir(download_dir) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False) and not entry.name.endswith('.zip'):
+                    files.append({
+                        "filename": entry.name,
+                        "size": entry.stat(follow_symlinks=False).st_size,
+                        "download_url": f"/api/file/{task_id}/{entry.name}"
+                    })
+        return files
     
+    # Directory listing and per-file stats are blocking; keep them off the event loop
+    files = await asyncio.get_running_loop().run_in_executor(None, list_files)
     return {"files": files}
 
 @app.get("/api/file/{task_id}/{filename}")
 async def download_file(task_id: str, filename: str):
     """Serve downloaded video files"""
     # Get the shared download directory for this task
-    with storage_lock:
+    with get_task_lock(task_id):
         if task_id in tasks_storage:
             download_dir = tasks_storage[task_id].get('download_dir')
         else:
@@ -348,11 +580,12 @@ async def download_zip(task_id: str):
     
     if not os.path.exists(zip_path):
         # Try to recreate the zip if task data is available
-        with storage_lock:
+        download_dir = None
+        with get_task_lock(task_id):
             if task_id in tasks_storage and task_id in video_downloads:
                 download_dir = tasks_storage[task_id].get('download_dir')
-                if download_dir:
-                    create_task_zip_file(task_id, download_dir, zip_path)
+        if download_dir:
+            await build_task_zip(task_id, download_dir, zip_path)
         
         if not os.path.exists(zip_path):
             raise HTTPException(status_code=404, detail="Zip file not found")
@@ -371,6 +604,7 @@ async def start_download_enhanced(request: DownloadRequest, background_tasks: Ba
     
     # Initialize video downloads list and task status
     with storage_lock:
+        task_locks[task_id] = threading.RLock()
         video_downloads[task_id] = []
         task_status = {
             "status": "initializing",
@@ -398,7 +632,7 @@ async def get_progress(task_id: str):
         raise HTTPException(status_code=404, detail="Task not found")
     
     # Generate progress text from task status and video downloads
-    with storage_lock:
+    with get_task_lock(task_id):
         task_data = tasks_storage[task_id].copy()
         videos = video_downloads.get(task_id, []).copy()
     
@@ -452,7 +686,7 @@ async def process_download_enhanced(task_id: str, request: DownloadRequest, opti
             return
         
         # Initialize video download objects
-        with storage_lock:
+        with get_task_lock(task_id):
             video_downloads[task_id] = [
                 VideoDownload(
                     url=info['url'],
@@ -461,8 +695,12 @@ async def process_download_enhanced(task_id: str, request: DownloadRequest, opti
                     video_id_hash=info.get('video_id_hash', '')
                 ) for info in video_info_list
             ]
-            tasks_storage[task_id]['total_videos'] = len(video_info_list)
-            tasks_storage[task_id]['download_dir'] = download_dir  # Store the shared dir
+            video_status_counts[task_id] = {'pending': len(video_info_list)}
+            video_index_by_hash[task_id] = {
+                v.video_id_hash: i for i, v in enumerate(video_downloads[task_id]) if v.video_id_hash
+            }
+            # download_dir stores the shared dir
+            tasks_storage[task_id].update(total_videos=len(video_info_list), download_dir=download_dir)
         
         total_videos = len(video_info_list)
         duplicate_check_msg = " (checking for duplicates)" if request.skip_duplicates else ""
@@ -474,12 +712,13 @@ async def process_download_enhanced(task_id: str, request: DownloadRequest, opti
         
         # Create zip file with downloaded files for this specific task
         zip_path = f"downloads/tasks/{task_id}.zip"
-        create_task_zip_file(task_id, download_dir, zip_path)
+        await build_task_zip(task_id, download_dir, zip_path)
         
-        with storage_lock:
-            success_count = sum(1 for v in video_downloads[task_id] if v.status in ['completed', 'skipped'])
-            failure_count = sum(1 for v in video_downloads[task_id] if v.status == 'failed')
-            skipped_count = sum(1 for v in video_downloads[task_id] if v.status == 'skipped')
+        with get_task_lock(task_id):
+            counts = video_status_counts.get(task_id, {})
+            success_count = count_finished(counts)
+            failure_count = counts.get('failed', 0)
+            skipped_count = counts.get('skipped', 0)
         
         status_msg = f"Download completed! {success_count} successful"
         if skipped_count > 0:
@@ -513,6 +752,7 @@ async def get_video_info_detailed(channel_url: str, max_videos: int) -> List[dic
             if not info:
                 return []
             if 'entries' in info and info['entries']:
+                seen_hashes = set()
                 # entries are flat dicts with "url" or "id"/"webpage_url"
                 for entry in info['entries']:
                     if not entry:
@@ -521,6 +761,10 @@ async def get_video_info_detailed(channel_url: str, max_videos: int) -> List[dic
                     url = entry.get('url') or entry.get('webpage_url') or f"https://www.youtube.com/watch?v={entry.get('id')}"
                     title = entry.get('title') or entry.get('fulltitle') or url
                     video_id_hash = generate_video_id_hash(url)
+                    # Playlists can list the same video more than once; download it once
+                    if video_id_hash in seen_hashes:
+                        continue
+                    seen_hashes.add(video_id_hash)
                     entries.append({
                         'url': url, 
                         'title': title,
@@ -554,7 +798,10 @@ async def download_videos_realtime(task_id: str, video_info_list: List[dict],
     ydl_base_opts = {
         'ignoreerrors': True,
         'no_warnings': True,
-        'concurrent_fragment_downloads': 4,
+        'concurrent_fragment_downloads': FRAGMENT_CONCURRENCY,
+        'http_chunk_size': 10 * 1024 * 1024,  # fetch non-fragmented streams in 10 MiB ranges
+        'buffersize': 1024 * 1024,  # 1 MiB reads/writes instead of the 1 KiB default
+        'socket_timeout': 30,
         'fragment_retries': 3,
         'retries': 2,
         'no_overwrites': True,
@@ -583,13 +830,7 @@ async def download_videos_realtime(task_id: str, video_info_list: List[dict],
             'extract_flat': False,
         })
         
-        # Only add conversion if explicitly requested (slower but consistent format)
-        if request.convert_to_mp3:
-            ydl_base_opts['postprocessors'] = [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }]
+        # MP3 conversion (if requested) runs after the download on mp3_executor
     else:
         # Video downloads
         ydl_base_opts.update({
@@ -597,26 +838,23 @@ async def download_videos_realtime(task_id: str, video_info_list: List[dict],
             'outtmpl': f'{download_dir}/%(title)s_%(id)s.%(ext)s',
         })
 
+    # video index -> (monotonic time, progress %) of the last pushed update
+    last_progress_push: Dict[int, Tuple[float, float]] = {}
+
     # progress hook that will be called by yt_dlp inside worker thread
     def progress_hook(d):
         try:
             status = d.get('status')
-            # Determine index of downloading video (find the first with status 'downloading' or matching filepath)
-            with storage_lock:
+            # Determine index of downloading video from the video ID in its filename
+            with get_task_lock(task_id):
                 videos = video_downloads.get(task_id, [])
+                hash_to_idx = video_index_by_hash.get(task_id, {})
             idx = None
-            # Try to find by filename if present
             filename = d.get('filename') or d.get('tmpfilename') or d.get('filepath')
             if filename:
-                base = os.path.basename(filename)
-                for i, v in enumerate(videos):
-                    # note: videos titles were restricted in outtmpl; we can match by startswith title or by presence of base in filename
-                    if v.filename and base == v.filename:
-                        idx = i
-                        break
-                    # fallback: compare sanitized title or video ID hash
-                    if v.video_id_hash and v.video_id_hash in base:
-                        idx = i
+                for match in _PARTIAL_FILENAME_VIDEO_ID_RE.finditer(os.path.basename(filename)):
+                    idx = hash_to_idx.get(match.group(1))
+                    if idx is not None:
                         break
             # fallback: pick first 'downloading'
             if idx is None:
@@ -628,70 +866,127 @@ async def download_videos_realtime(task_id: str, video_info_list: List[dict],
                 return  # cannot attribute progress
 
             # Update fields
-            with storage_lock:
+            with get_task_lock(task_id):
                 v = video_downloads[task_id][idx]
                 if status == 'downloading':
                     downloaded = d.get('downloaded_bytes') or d.get('downloaded_bytes_estimate') or 0
                     total = d.get('total_bytes') or d.get('total_bytes_estimate') or 0
                     v.downloaded_size = int(downloaded) if downloaded else v.downloaded_size
                     v.file_size = int(total) if total else v.file_size
-                    if v.file_size:
-                        try:
-                            v.progress = (v.downloaded_size / v.file_size) * 100
-                        except Exception:
-                            v.progress = 0.0
-                    else:
-                        v.progress = 0.0
-                    v.speed = format_bytes(d.get('speed'))
-                    v.eta = format_eta(d.get('eta'))
+                    v.progress = 100.0 * v.downloaded_size / v.file_size if v.file_size else 0.0
+                    speed = d.get('speed')
+                    eta = d.get('eta')
+                    v.speed = format_bytes(int(speed) if speed else None)
+                    v.eta = format_eta(int(eta) if eta is not None else None)
                 elif status == 'finished':
                     # finished downloading fragments — yt-dlp will soon postprocess/rename
                     v.progress = 100.0
                     v.speed = '0 B/s'
                     v.eta = '0:00:00'
+                progress = v.progress
+            # Coalesce ticks: skip the push unless enough time or progress has passed
+            now = time.monotonic()
+            last = last_progress_push.get(idx)
+            if (status == 'downloading' and last
+                    and now - last[0] < PROGRESS_PUSH_INTERVAL
+                    and abs(progress - last[1]) < PROGRESS_PUSH_MIN_DELTA):
+                return
+            last_progress_push[idx] = (now, progress)
             # Schedule async update safely on MAIN_LOOP
-            asyncio.run_coroutine_threadsafe(send_video_progress_update(task_id), MAIN_LOOP)
+            mark_progress_dirty(task_id)
         except Exception as e:
             # don't crash the hook
             print("progress_hook error:", e)
 
-    def download_single_video(video_info: dict, index: int):
-        """Blocking function executed in thread pool to download a single video."""
+    # One YoutubeDL per worker thread for this batch, so options, format selectors
+    # and extractors are set up once per thread rather than once per video
+    worker_ydl = threading.local()
+    created_ydls: List[yt_dlp.YoutubeDL] = []
+
+    def get_worker_ydl() -> yt_dlp.YoutubeDL:
+        ydl = getattr(worker_ydl, 'ydl', None)
+        if ydl is None:
+            ydl_opts = dict(ydl_base_opts)
+            ydl_opts['progress_hooks'] = [progress_hook]
+            ydl = worker_ydl.ydl = yt_dlp.YoutubeDL(ydl_opts)
+            created_ydls.append(ydl)
+        return ydl
+
+    def record_video_result(index: int, downloaded_filename: Optional[str]):
+        """Mark a video completed (or failed if no file was found) and push the change"""
+        with get_task_lock(task_id):
+            vd = video_downloads[task_id][index]
+            if downloaded_filename:
+                set_video_status(task_id, vd, 'completed')
+                vd.filename = downloaded_filename
+                try:
+                    vd.file_size = os.stat(os.path.join(download_dir, downloaded_filename)).st_size
+                except FileNotFoundError:
+                    pass
+                vd.progress = 100.0
+                vd.end_time = datetime.now()
+                # update task counters
+                completed = count_finished(video_status_counts[task_id])
+                tasks_storage[task_id].update(progress=completed, success_count=completed)
+            else:
+                set_video_status(task_id, vd, 'failed')
+                vd.error = 'Downloaded but file not found'
+                vd.end_time = datetime.now()
+                tasks_storage[task_id]['failure_count'] = video_status_counts[task_id]['failed']
+        mark_progress_dirty(task_id)
+
+    def record_video_failure(index: int, error: str):
+        """Mark a video failed with the given error and push the change"""
+        with get_task_lock(task_id):
+            vd = video_downloads[task_id][index]
+            set_video_status(task_id, vd, 'failed')
+            vd.error = error
+            vd.end_time = datetime.now()
+            tasks_storage[task_id]['failure_count'] = video_status_counts[task_id]['failed']
+        mark_progress_dirty(task_id)
+
+    def download_single_video(video_info: dict, index: int) -> Optional[str]:
+        """
+        Blocking function executed in thread pool to download a single video.
+        Returns the downloaded file's path if it still needs MP3 conversion,
+        otherwise records the result itself and returns None.
+        """
         try:
             title = video_info.get('title', 'Unknown Video')
             url = video_info['url']
-            video_id_hash = video_info.get('video_id_hash', generate_video_id_hash(url))
+            video_id_hash = video_info['video_id_hash']
             
             # Mark as checking for duplicates
-            with storage_lock:
+            with get_task_lock(task_id):
                 vd = video_downloads[task_id][index]
-                vd.status = 'checking'
+                set_video_status(task_id, vd, 'checking')
                 vd.video_id_hash = video_id_hash
-            asyncio.run_coroutine_threadsafe(send_video_progress_update(task_id), MAIN_LOOP)
+            mark_progress_dirty(task_id)
 
             # Check for existing files if skip_duplicates is enabled
             if request.skip_duplicates:
-                existing_file = check_existing_file(download_dir, title, video_id_hash, request.audio_only)
+                existing_file = check_existing_file(download_dir, title, video_id_hash, request.audio_only,
+                                                    index=download_index)
                 if existing_file:
-                    with storage_lock:
+                    with get_task_lock(task_id):
                         vd = video_downloads[task_id][index]
-                        vd.status = 'skipped'
+                        set_video_status(task_id, vd, 'skipped')
                         vd.filename = existing_file
-                        vd.file_size = os.path.getsize(os.path.join(download_dir, existing_file))
+                        size = download_index.sizes.get(existing_file) if download_index else None
+                        vd.file_size = size if size is not None else os.path.getsize(os.path.join(download_dir, existing_file))
                         vd.progress = 100.0
                         vd.skipped_reason = f"Already exists: {existing_file}"
                         vd.end_time = datetime.now()
                         # update task counters
-                        completed = sum(1 for v in video_downloads[task_id] if v.status in ['completed', 'skipped'])
-                        tasks_storage[task_id]['progress'] = completed
-                        tasks_storage[task_id]['success_count'] = completed
-                    asyncio.run_coroutine_threadsafe(send_video_progress_update(task_id), MAIN_LOOP)
-                    return True
+                        completed = count_finished(video_status_counts[task_id])
+                        tasks_storage[task_id].update(progress=completed, success_count=completed)
+                    mark_progress_dirty(task_id)
+                    return None
 
             # Mark downloading
-            with storage_lock:
+            with get_task_lock(task_id):
                 vd = video_downloads[task_id][index]
-                vd.status = 'downloading'
+                set_video_status(task_id, vd, 'downloading')
                 vd.start_time = datetime.now()
                 # reset per-run fields
                 vd.progress = 0.0
@@ -700,101 +995,94 @@ async def download_videos_realtime(task_id: str, video_info_list: List[dict],
                 vd.error = ''
                 vd.filename = ''
             # push update
-            asyncio.run_coroutine_threadsafe(send_video_progress_update(task_id), MAIN_LOOP)
+            mark_progress_dirty(task_id)
 
-            # copy base opts so each call can have its own hooks
-            ydl_opts = dict(ydl_base_opts)
-            ydl_opts['progress_hooks'] = [progress_hook]
-
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=True)
-                # After download, try to infer downloaded filepath(s)
-                downloaded_filename = None
-                # yt-dlp can return a dict with 'requested_downloads'
-                if info and isinstance(info, dict):
-                    # If postprocessing changed the filename, 'requested_downloads' might contain filepaths
-                    rds = info.get('requested_downloads')
-                    if rds:
-                        for dwn in rds:
-                            fp = dwn.get('filepath') or dwn.get('filename')
-                            if fp and os.path.exists(fp):
-                                downloaded_filename = os.path.basename(fp)
-                                break
-                    # Another fallback: 'files' key or 'filename'
-                    if not downloaded_filename:
-                        candidate = info.get('filename') or info.get('requested_formats', [{}])[0].get('filepath')
-                        if candidate and os.path.exists(candidate):
-                            downloaded_filename = os.path.basename(candidate)
-
-                # If not found, attempt to guess by looking in download_dir for recent files with video ID
+            ydl = get_worker_ydl()
+            info = ydl.extract_info(url, download=True)
+            # After download, try to infer downloaded filepath(s)
+            downloaded_filename = None
+            # yt-dlp can return a dict with 'requested_downloads'
+            if info and isinstance(info, dict):
+                # If postprocessing changed the filename, 'requested_downloads' might contain filepaths
+                rds = info.get('requested_downloads')
+                if rds:
+                    for dwn in rds:
+                        fp = dwn.get('filepath') or dwn.get('filename')
+                        if fp and os.path.exists(fp):
+                            downloaded_filename = os.path.basename(fp)
+                            break
+                # Another fallback: 'files' key or 'filename'
                 if not downloaded_filename:
-                    # Look for files containing the video ID hash
-                    pattern = f"*{video_id_hash}*"
-                    matches = glob.glob(os.path.join(download_dir, pattern))
-                    if matches:
-                        # Get most recently created file
-                        matches.sort(key=lambda x: os.path.getctime(x), reverse=True)
-                        downloaded_filename = os.path.basename(matches[0])
-
-                with storage_lock:
-                    if downloaded_filename:
-                        vd = video_downloads[task_id][index]
-                        vd.status = 'completed'
-                        vd.filename = downloaded_filename
-                        file_path = os.path.join(download_dir, downloaded_filename)
-                        if os.path.exists(file_path):
-                            vd.file_size = os.path.getsize(file_path)
-                        vd.progress = 100.0
-                        vd.end_time = datetime.now()
-                        # update task counters
-                        completed = sum(1 for v in video_downloads[task_id] if v.status in ['completed', 'skipped'])
-                        tasks_storage[task_id]['progress'] = completed
-                        tasks_storage[task_id]['success_count'] = completed
-                    else:
-                        vd = video_downloads[task_id][index]
-                        vd.status = 'failed'
-                        vd.error = 'Downloaded but file not found'
-                        vd.end_time = datetime.now()
-                        failed = sum(1 for v in video_downloads[task_id] if v.status == 'failed')
-                        tasks_storage[task_id]['failure_count'] = failed
+                    candidate = info.get('filename') or info.get('requested_formats', [{}])[0].get('filepath')
+                    if candidate and os.path.exists(candidate):
+                        downloaded_filename = os.path.basename(candidate)
+
+            # If not found, attempt to guess by looking in download_dir for recent files with video ID
+            if not downloaded_filename:
+                # Look for files containing the video ID hash in a single directory pass
+                with os.scandir(download_dir) as entries:
+                    matches = [e for e in entries if video_id_hash in e.name and e.is_file()]
+                if matches:
+                    # Get most recently created file
+                    newest = max(matches, key=lambda e: e.stat().st_ctime)
+                    downloaded_filename = newest.name
+
+            # Hand the file back for MP3 conversion; the video completes once it's encoded
+            if downloaded_filename and request.audio_only and request.convert_to_mp3:
+                return os.path.join(download_dir, downloaded_filename)
+
+            record_video_result(index, downloaded_filename)
+            return None
+        except Exception as e:
+            record_video_failure(index, str(e))
+            return None
 
-            # final update for this video
-            asyncio.run_coroutine_threadsafe(send_video_progress_update(task_id), MAIN_LOOP)
-            return True
+    async def download_video(video_info: dict, index: int):
+        """Download one video, then (if requested) encode it to MP3 on the encode pool"""
+        source_path = await loop.run_in_executor(download_executor, download_single_video, video_info, index)
+        if source_path is None:
+            return
+        try:
+            mp3_path = await loop.run_in_executor(mp3_executor, convert_to_mp3, source_path)
         except Exception as e:
-            with storage_lock:
-                video_downloads[task_id][index].status = 'failed'
-                video_downloads[task_id][index].error = str(e)
-                video_downloads[task_id][index].end_time = datetime.now()
-                failed = sum(1 for v in video_downloads[task_id] if v.status == 'failed')
-                tasks_storage[task_id]['failure_count'] = failed
-            asyncio.run_coroutine_threadsafe(send_video_progress_update(task_id), MAIN_LOOP)
-            return False
-
-    # Submit download tasks to threadpool
-    futures = []
-    for i, video_info in enumerate(video_info_list):
-        futures.append(download_executor.submit(download_single_video, video_info, i))
-
-    # Wait for all to finish (this excludes internal progress coroutine scheduling, which runs on MAIN_LOOP)
-    for future in futures:
+            record_video_failure(index, f"MP3 conversion failed: {e}")
+            return
+        record_video_result(index, os.path.basename(mp3_path))
+
+    # Hash any IDs the info fetch didn't provide up front, off the worker threads
+    for video_info in video_info_list:
+        if not video_info.get('video_id_hash'):
+            video_info['video_id_hash'] = generate_video_id_hash(video_info['url'])
+
+    # Index existing files once for the whole batch instead of scanning per video
+    download_index = build_download_index(download_dir, request.audio_only) if request.skip_duplicates else None
+
+    # Run the blocking downloads in the threadpool (its worker count bounds concurrency)
+    # and await them, so the event loop keeps serving requests and progress pushes
+    loop = asyncio.get_running_loop()
+    downloads = [download_video(video_info, i) for i, video_info in enumerate(video_info_list)]
+    # Handle downloads in the order they finish, not the order they were submitted
+    for finished in asyncio.as_completed(downloads):
         try:
-            future.result()
+            await finished
         except Exception as e:
             # already handled per-video
             print("download thread error:", e)
+    for ydl in created_ydls:
+        ydl.close()
 
-async def send_video_progress_update(task_id: str):
-    """Send real-time progress update via WebSocket (safe to call from MAIN_LOOP)."""
-    with storage_lock:
+def build_progress_payload(task_id: str, now_iso: Optional[str] = None) -> Optional[dict]:
+    """Refresh a task's aggregate status and build its progress WebSocket message"""
+    with get_task_lock(task_id):
         if task_id not in tasks_storage or task_id not in video_downloads:
-            return
+            return None
         videos = video_downloads[task_id]
-        completed = sum(1 for v in videos if v.status in ['completed', 'skipped'])
-        failed = sum(1 for v in videos if v.status == 'failed')
-        downloading = sum(1 for v in videos if v.status == 'downloading')
-        checking = sum(1 for v in videos if v.status == 'checking')
-        skipped = sum(1 for v in videos if v.status == 'skipped')
+        counts = video_status_counts.get(task_id, {})
+        completed = count_finished(counts)
+        failed = counts.get('failed', 0)
+        downloading = counts.get('downloading', 0)
+        checking = counts.get('checking', 0)
+        skipped = counts.get('skipped', 0)
         # choose an active speed (first non-zero)
         active_speed = next((v.speed for v in videos if v.status == 'downloading' and v.speed != '0 B/s'), '0 B/s')
         tasks_storage[task_id].update({
@@ -807,19 +1095,32 @@ async def send_video_progress_update(task_id: str):
             'download_speed': active_speed,
             'active_downloads': downloading,
             'current_video': f"{downloading} downloading, {completed} completed, {failed} failed",
-            'updated_at': datetime.now().isoformat()
+            'updated_at': now_iso or datetime.now().isoformat()
         })
-        payload = {
-            'type': 'progress_update',
-            'task_status': tasks_storage[task_id],
-            'video_downloads': [asdict(v) for v in videos]
-        }
-    await manager.send_update(task_id, payload)
+        video_dicts = [v.to_dict() for v in videos]
+        last_sent = progress_sent_videos.get(task_id)
+        progress_sent_videos[task_id] = video_dicts
+        if last_sent is not None and len(last_sent) == len(video_dicts):
+            # Only videos whose cached dict was rebuilt (i.e. mutated) since the last push
+            payload = {
+                'type': 'progress_update_delta',
+                'task_status': tasks_storage[task_id],
+                'changes': [{'index': i, 'video': d}
+                            for i, (d, old) in enumerate(zip(video_dicts, last_sent)) if d is not old]
+            }
+        else:
+            # Reuse the task's payload dict and list; send_update encodes it before yielding
+            payload = progress_payloads.get(task_id)
+            if payload is None:
+                payload = progress_payloads[task_id] = {'type': 'progress_update', 'video_downloads': []}
+            payload['task_status'] = tasks_storage[task_id]
+            payload['video_downloads'][:] = video_dicts
+    return payload
 
 async def update_task_status_realtime(task_id: str, status: str, progress: int, total: int, 
                                     current: str, zip_available: bool = False, completed: bool = False):
     """Update task status with real-time WebSocket notification"""
-    with storage_lock:
+    with get_task_lock(task_id):
         if task_id in tasks_storage:
             tasks_storage[task_id].update({
                 "status": status,
@@ -838,13 +1139,21 @@ async def update_task_status_realtime(task_id: str, status: str, progress: int,
 def create_zip_file(source_dir: str, zip_path: str):
     """Create a zip file from downloaded files"""
     try:
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        with open(zip_path, 'wb', buffering=ZIP_IO_BUFFER_SIZE) as f, \
+                zipfile.ZipFile(f, 'w', zipfile.ZIP_DEFLATED, allowZip64=True) as zipf:
             for root, _, files in os.walk(source_dir):
                 for file in files:
                     if not file.endswith('.zip'):
                         file_path = os.path.join(root, file)
                         arcname = os.path.relpath(file_path, source_dir)
-                        zipf.write(file_path, arcname)
+                        # Already-compressed media is stored; deflating it only burns CPU
+                        if os.path.splitext(file)[1].lower() in COMPRESSED_MEDIA_EXTENSIONS:
+                            zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+                            with open(file_path, 'rb', buffering=ZIP_IO_BUFFER_SIZE) as src, \
+                                    zipf.open(zinfo, 'w', force_zip64=True) as dst:
+                                shutil.copyfileobj(src, dst, ZIP_IO_BUFFER_SIZE)
+                        else:
+                            zipf.write(file_path, arcname)
     except Exception as e:
         print(f"Error creating zip file: {e}")
 